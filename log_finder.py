@@ -4,49 +4,187 @@ import tarfile
 import tempfile
 import shutil
 import argparse
+import codecs
 import gzip
+import functools
+import mmap
+import queue
 import re
+import subprocess
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Tuple, Dict
-from datetime import datetime
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Tuple, Dict
+from datetime import datetime, timedelta
+from itertools import chain, repeat
+
+try:
+    # Optional: block-parallel gzip decompression
+    import rapidgzip
+except ImportError:
+    rapidgzip = None
+
+try:
+    # Optional: single-pass multi-pattern matching
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    # Optional: SIMD-accelerated multi-pattern matching
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+# Large reads for tar archives: an 8 MiB buffered file under a 1 MiB tar stream buffer
+_TAR_FILE_BUFFER = 8 << 20
+_TAR_RECORD_BUFFER = 1 << 20
 
 def extract_tar_file(tar_path: str, extract_to: str) -> None:
-    """Extract a tar file to the specified directory."""
-    with tarfile.open(tar_path, 'r') as tar:
-        tar.extractall(extract_to)
-
-def find_tar_gz_files(directory: str) -> List[str]:
-    """Find all .tar.gz files in the given directory."""
-    tar_gz_files = []
-    for root, dirs, files in os.walk(directory):
-        for file in files:
-            if file.endswith('.tar.gz'):
-                tar_gz_files.append(os.path.join(root, file))
-    return tar_gz_files
-
-def find_log_files(directory: str) -> List[str]:
-    """Find all log files (both compressed and uncompressed) in the given directory."""
-    log_files = []
-    for root, dirs, files in os.walk(directory):
-        for file in files:
-            # Match uncompressed .log files (but not .log.gz_* files)
-            if file.endswith('.log') and not re.match(r'.*\.log\.gz_\d+', file):
-                log_files.append(os.path.join(root, file))
-            # Match rotated log files (.log_numbers)
-            elif re.match(r'.*\.log_\d+$', file):
-                log_files.append(os.path.join(root, file))
-    return log_files
-
-def find_compressed_log_files(directory: str) -> List[str]:
-    """Find all compressed log files (.gz, .log.gz_*) in the given directory."""
-    compressed_files = []
-    for root, dirs, files in os.walk(directory):
-        for file in files:
-            # Match .gz files (excluding .tar.gz) and .log.gz_* pattern files
-            if (file.endswith('.gz') and not file.endswith('.tar.gz')) or \
-               re.match(r'.*\.log\.gz_\d+', file):
-                compressed_files.append(os.path.join(root, file))
-    return compressed_files
+    """
+    Extract the log files and nested .tar.gz archives of a tar file to the specified directory.
+
+    The archive is read as a stream and every other member is skipped
+    instead of being written to disk.
+    """
+    with open(tar_path, 'rb', buffering=_TAR_FILE_BUFFER) as raw, \
+         tarfile.open(fileobj=raw, mode='r|*', bufsize=_TAR_RECORD_BUFFER) as tar:
+        for member in tar:
+            if _is_log_like(member.name):
+                tar.extract(member, extract_to)
+
+def _merge_tree(src: str, dest: str, tar_gz_file: str) -> None:
+    """
+    Move everything below src into dest, replacing files that already exist there.
+
+    Entries that can't be moved, such as a file where an earlier archive
+    created a directory, are reported as extraction errors for tar_gz_file
+    and skipped.
+    """
+    try:
+        os.makedirs(dest, exist_ok=True)
+    except OSError as e:
+        print(f"Error extracting {tar_gz_file}: {e}")
+        return
+    with os.scandir(src) as it:
+        for entry in it:
+            target = os.path.join(dest, entry.name)
+            if entry.is_dir(follow_symlinks=False):
+                _merge_tree(entry.path, target, tar_gz_file)
+                continue
+            try:
+                os.replace(entry.path, target)
+            except OSError as e:
+                print(f"Error extracting {tar_gz_file}: {e}")
+
+def extract_tar_gz_files(tar_gz_files: List[str], extract_to: str) -> None:
+    """
+    Extract several .tar.gz files into one directory concurrently.
+
+    Each archive is extracted into its own staging directory, and the
+    staging directories are merged in archive order afterwards. Archives
+    that contain the same path therefore never write one file at the same
+    time, and the last archive's copy wins, as with serial extraction.
+    """
+    print_lock = threading.Lock()
+    staging_root = tempfile.mkdtemp(prefix='staging-', dir=os.path.dirname(os.path.abspath(extract_to)))
+    staging_dirs = [os.path.join(staging_root, str(i)) for i in range(len(tar_gz_files))]
+
+    def extract(tar_gz_file: str, staging_dir: str) -> None:
+        with print_lock:
+            print(f"Extracting: {os.path.basename(tar_gz_file)}")
+        try:
+            extract_tar_file(tar_gz_file, staging_dir)
+        except Exception as e:
+            with print_lock:
+                print(f"Error extracting {tar_gz_file}: {e}")
+
+    try:
+        # zlib inflate and file writes release the GIL, so threads scale here
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+            list(executor.map(extract, tar_gz_files, staging_dirs))
+        # Staging directories are on the same file system, so merging only renames
+        for tar_gz_file, staging_dir in zip(tar_gz_files, staging_dirs):
+            if os.path.isdir(staging_dir):
+                _merge_tree(staging_dir, extract_to, tar_gz_file)
+    finally:
+        shutil.rmtree(staging_root, ignore_errors=True)
+
+# Rotated log name suffixes, e.g. app.log_3 and app.log.gz_3
+_LOG_N = re.compile(r'\.log_\d+$')
+_LOG_GZ_N = re.compile(r'\.log\.gz_\d+$')
+
+# A match: (line number, line start offset, line end offset, matched pattern, line bytes).
+# Line bytes are kept, cut at MAX_LINE_BYTES, for files that can't be seeked cheaply
+# (compressed logs); they are None where the line is read back by offset at report time.
+Match = Tuple[int, int, int, str, Optional[bytes]]
+
+# Longest line content written to the report
+MAX_LINE_BYTES = 4096
+
+# Timestamp input format: yyyy-MM-dd-HH.mm.ss.SSSSSS
+_TIMESTAMP = re.compile(r'(\d{4})-(\d{2})-(\d{2})-(\d{2})\.(\d{2})\.(\d{2})\.(\d+)')
+
+def _scan(dirpath: str) -> Iterator[os.DirEntry]:
+    """Recursively yield file entries below dirpath without following directory symlinks."""
+    try:
+        with os.scandir(dirpath) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _scan(entry.path)
+                elif entry.is_file():
+                    yield entry
+    except OSError:
+        # Unreadable directories are skipped, as os.walk does
+        return
+
+# File kinds returned by _classify_name
+TAR_GZ, LOG, COMPRESSED_LOG = 'tar.gz', 'log', 'compressed_log'
+
+def _classify_name(name: str) -> Optional[str]:
+    """Classify a file name as a .tar.gz archive, an uncompressed log or a compressed log."""
+    if name.endswith('.gz'):
+        # Match .gz files, keeping .tar.gz archives apart
+        return TAR_GZ if name.endswith('.tar.gz') else COMPRESSED_LOG
+    # Match uncompressed .log files
+    if name.endswith('.log'):
+        return LOG
+    # Match rotated log files (.log_numbers and .log.gz_numbers)
+    if '.log_' in name and _LOG_N.search(name):
+        return LOG
+    if '.log.gz_' in name and _LOG_GZ_N.search(name):
+        return COMPRESSED_LOG
+    return None
+
+def _is_log_like(path: str) -> bool:
+    """Check if a path names something worth extracting: a log file or a .tar.gz archive."""
+    return _classify_name(os.path.basename(path)) is not None
+
+class LogFile(NamedTuple):
+    """A log file found by classify_tree, with the stat fields used to skip it early."""
+    path: str
+    compressed: bool
+    size: int
+    mtime: float
+
+def classify_tree(root: str) -> Tuple[List[str], List[LogFile], List[LogFile]]:
+    """
+    Walk the given directory once and sort its files by kind.
+
+    Returns (tar_gz_files, log_files, compressed_log_files).
+    """
+    found = {TAR_GZ: [], LOG: [], COMPRESSED_LOG: []}
+    for entry in _scan(root):
+        kind = _classify_name(entry.name)
+        if kind == TAR_GZ:
+            found[kind].append(entry.path)
+        elif kind is not None:
+            try:
+                st = entry.stat()
+            except OSError:
+                continue
+            found[kind].append(LogFile(entry.path, kind == COMPRESSED_LOG, st.st_size, st.st_mtime))
+    return found[TAR_GZ], found[LOG], found[COMPRESSED_LOG]
 
 def parse_timestamp_input(timestamp_str: str) -> List[str]:
     """
@@ -69,7 +207,7 @@ def parse_timestamp_input(timestamp_str: str) -> List[str]:
     # Try to parse the timestamp to generate other formats
     try:
         # Parse the input format: yyyy-MM-dd-HH.mm.ss.SSSSSS
-        match = re.match(r'(\d{4})-(\d{2})-(\d{2})-(\d{2})\.(\d{2})\.(\d{2})\.(\d+)', timestamp_str)
+        match = _TIMESTAMP.match(timestamp_str)
         if match:
             year, month, day, hour, minute, second, microsecond = match.groups()
             
@@ -99,53 +237,482 @@ def parse_timestamp_input(timestamp_str: str) -> List[str]:
     
     return unique_patterns
 
+def timestamp_to_datetime(timestamp_str: str) -> datetime:
+    """Convert a yyyy-MM-dd-HH.mm.ss.SSSSSS timestamp to a (local, naive) datetime, ignoring the fraction."""
+    year, month, day, hour, minute, second, _ = _TIMESTAMP.match(timestamp_str).groups()
+    return datetime(int(year), int(month), int(day), int(hour), int(minute), int(second))
+
+def parse_date(date_str: str) -> datetime:
+    """Parse a yyyy-MM-dd command line date."""
+    return datetime.strptime(date_str, '%Y-%m-%d')
+
 def is_timestamp_format(search_string: str) -> bool:
     """Check if the search string looks like a timestamp."""
     # Check for the specific format: yyyy-MM-dd-HH.mm.ss.SSSSSS
-    timestamp_pattern = r'^\d{4}-\d{2}-\d{2}-\d{2}\.\d{2}\.\d{2}\.\d+$'
-    return bool(re.match(timestamp_pattern, search_string))
+    return _TIMESTAMP.fullmatch(search_string) is not None
+
+# Read size for streamed searches, cut back to the last full line
+_READ_CHUNK = 64 << 20
+
+# Decompressed read size and queue depth for the gzip read-ahead thread
+_GZIP_CHUNK = 1 << 20
+_GZIP_QUEUE_DEPTH = 4
+
+# Aho-Corasick automata per needle list, built once per process
+_automata: Dict[Tuple[bytes, ...], object] = {}
+
+def _get_automaton(needles: List[bytes]):
+    """
+    Return a cached Aho-Corasick automaton for the needles, or None if unavailable.
+
+    The automaton works on str, so needles are stored read as latin-1; a
+    buffer decoded the same way keeps byte offsets intact.
+    """
+    if ahocorasick is None or len(needles) < 2 or not all(needles):
+        return None
+    key = tuple(needles)
+    automaton = _automata.get(key)
+    if automaton is None:
+        automaton = ahocorasick.Automaton()
+        for index, needle in enumerate(needles):
+            word = needle.decode('latin-1')
+            # Duplicate patterns keep the index of their first occurrence
+            if not automaton.exists(word):
+                automaton.add_word(word, (index, len(word)))
+        automaton.make_automaton()
+        _automata[key] = automaton
+    return automaton
 
-def is_compressed_file(file_path: str) -> bool:
-    """Check if a file is compressed based on its name."""
-    filename = os.path.basename(file_path)
-    return filename.endswith('.gz') or re.match(r'.*\.log\.gz_\d+', filename)
+# Hyperscan databases per needle list, compiled once per process
+_hyperscan_dbs: Dict[Tuple[bytes, ...], object] = {}
+
+def _get_hyperscan_db(needles: List[bytes]):
+    """Return a cached Hyperscan literal database for the needles, or None if unavailable."""
+    if hyperscan is None or len(needles) < 2 or not all(needles):
+        return None
+    key = tuple(needles)
+    db = _hyperscan_dbs.get(key)
+    if db is None:
+        db = hyperscan.Database()
+        db.compile(
+            expressions=list(needles),
+            ids=list(range(len(needles))),
+            elements=len(needles),
+            literal=True,
+        )
+        _hyperscan_dbs[key] = db
+    return db
+
+# Literal alternation regexes per needle list, compiled once per process
+_alternations: Dict[Tuple[bytes, ...], re.Pattern] = {}
+
+def _get_alternation(needles: List[bytes]) -> Optional[re.Pattern]:
+    """Return a cached regex matching any of the needles, or None for fewer than two."""
+    if len(needles) < 2 or not all(needles):
+        return None
+    key = tuple(needles)
+    alternation = _alternations.get(key)
+    if alternation is None:
+        alternation = re.compile(b'|'.join(re.escape(needle) for needle in needles))
+        _alternations[key] = alternation
+    return alternation
+
+# Window size for one-sweep matchers, so a whole mmap is never copied at once
+_SCAN_WINDOW = 64 << 20
+
+# Longest window when no line boundary turns up (hs_scan takes an unsigned int length)
+_MAX_SCAN_WINDOW = (4 << 30) - 1
+
+def _scan_windows(buf, overlap: int) -> Iterator[Tuple[int, int]]:
+    """
+    Yield (start, end) windows covering the buffer, each ending on a line boundary.
+
+    A window that would exceed _MAX_SCAN_WINDOW without reaching a newline
+    is cut there instead, and the next window starts overlap bytes earlier
+    so that a needle crossing the cut is still found.
+    """
+    size = len(buf)
+    start = 0
+    while start < size:
+        end = start + _SCAN_WINDOW
+        if end >= size:
+            yield start, size
+            return
+        newline = buf.find(b'\n', end, start + _MAX_SCAN_WINDOW)
+        if newline != -1:
+            yield start, newline + 1
+            start = newline + 1
+            continue
+        end = min(start + _MAX_SCAN_WINDOW, size)
+        yield start, end
+        if end == size:
+            return
+        start = end - overlap
+
+def _multi_pattern_hits(buf, needles: List[bytes]) -> Optional[List[Tuple[int, int]]]:
+    """
+    Find all needle occurrences in one pass over the buffer.
+
+    Returns (start offset, needle index) pairs ordered by match end, using
+    Hyperscan or else Aho-Corasick, or None when neither applies.
+    """
+    db = _get_hyperscan_db(needles)
+    if db is not None:
+        hits = []
+        window_start = 0
+        scanned_to = 0
+
+        def on_match(index, start, end, flags, context):
+            # Skip hits already found in the overlap with the previous window
+            if window_start + end > scanned_to:
+                hits.append((window_start + end - len(needles[index]), index))
+
+        overlap = max(len(needle) for needle in needles) - 1
+        with memoryview(buf) as view:
+            # hs_scan takes an unsigned int length, so large buffers go in windows
+            for window_start, window_end in _scan_windows(buf, overlap):
+                db.scan(view[window_start:window_end], match_event_handler=on_match)
+                scanned_to = window_end
+        return hits
+
+    automaton = _get_automaton(needles)
+    if automaton is not None:
+        hits = []
+        scanned_to = 0
+        overlap = max(len(needle) for needle in needles) - 1
+        with memoryview(buf) as view:
+            for start, end in _scan_windows(buf, overlap):
+                # Decode one window at a time; latin-1 keeps offsets byte-for-byte
+                text, _ = codecs.latin_1_decode(view[start:end])
+                for match_end, (index, length) in automaton.iter(text):
+                    # Skip hits already found in the overlap with the previous window
+                    if start + match_end >= scanned_to:
+                        hits.append((start + match_end - length + 1, index))
+                scanned_to = end
+        return hits
+    return None
+
+def _line_bounds(buf, hit: int) -> Tuple[int, int]:
+    """Return the start and end offsets of the line containing offset hit."""
+    line_start = buf.rfind(b'\n', 0, hit) + 1
+    line_end = buf.find(b'\n', hit)
+    if line_end == -1:
+        line_end = len(buf)
+    return line_start, line_end
+
+def _count_newlines(buf, start: int, end: int) -> int:
+    """Count newlines in buf[start:end], slicing at most _SCAN_WINDOW bytes at a time."""
+    count = 0
+    while start < end:
+        stop = min(start + _SCAN_WINDOW, end)
+        count += buf[start:stop].count(b'\n')
+        start = stop
+    return count
+
+def _search_buffer(buf, needles: List[bytes], first_line: int = 1, base_offset: int = 0,
+                   keep_lines: bool = False) -> List[Tuple[int, int, int, int, Optional[bytes]]]:
+    """
+    Search a bytes-like buffer (bytes or mmap) for multiple needles.
+
+    Returns matches like search_in_file, but with the needle index in place
+    of the pattern.
+
+    Several patterns are matched in one sweep with hyperscan or pyahocorasick
+    when installed, or else with a single regex alternation; a lone needle
+    is located with a C-level find per hit. Line numbers are resolved
+    afterwards by counting newlines between matching lines; line offsets
+    are reported relative to base_offset.
+    """
+    # Map line start offset -> (line end offset, index of first matching needle)
+    hit_lines = {}
+    hits = _multi_pattern_hits(buf, needles)
+    alternation = _get_alternation(needles) if hits is None else None
+    if hits is not None:
+        line_start, line_end = -1, -1
+        for hit, index in hits:
+            if hit > line_end:
+                line_start, line_end = _line_bounds(buf, hit)
+            previous = hit_lines.get(line_start)
+            if previous is None or index < previous[1]:
+                hit_lines[line_start] = (line_end, index)
+    elif alternation is not None:
+        pos = 0
+        while True:
+            match = alternation.search(buf, pos)
+            if match is None:
+                break
+            line_start, line_end = _line_bounds(buf, match.start())
+            # Alternation matches don't overlap, so pick the first needle by list order from the line itself
+            line = buf[line_start:line_end]
+            index = next(index for index, needle in enumerate(needles) if needle in line)
+            hit_lines[line_start] = (line_end, index)
+            pos = line_end + 1
+    else:
+        for index, needle in enumerate(needles):
+            pos = 0
+            while True:
+                hit = buf.find(needle, pos)
+                # An empty needle also "matches" at EOF, past the last line
+                if hit == -1 or hit == len(buf):
+                    break
+                line_start, line_end = _line_bounds(buf, hit)
+                previous = hit_lines.get(line_start)
+                if previous is None or index < previous[1]:
+                    hit_lines[line_start] = (line_end, index)
+                pos = line_end + 1
 
-def search_in_file(file_path: str, search_patterns: List[str]) -> List[Tuple[int, str, str]]:
-    """Search for multiple patterns in a file and return line numbers, content, and matched pattern."""
     matches = []
+    line_num = first_line
+    counted_to = 0
+    for line_start in sorted(hit_lines):
+        line_end, index = hit_lines[line_start]
+        line_num += _count_newlines(buf, counted_to, line_start)
+        counted_to = line_start
+        line = buf[line_start:min(line_end, line_start + MAX_LINE_BYTES)] if keep_lines else None
+        matches.append((line_num, base_offset + line_start, base_offset + line_end, index, line))
+    return matches
+
+def _read_ahead(f, chunk_size: int, depth: int) -> Iterator[bytes]:
+    """
+    Yield chunks of a binary file object read by a background thread.
+
+    zlib releases the GIL while inflating, so decompression of the next
+    chunks overlaps with searching the current one. At most depth chunks
+    are buffered.
+    """
+    chunks = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def put(item) -> bool:
+        while not stop.is_set():
+            try:
+                chunks.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            while True:
+                data = f.read(chunk_size)
+                if not put(data) or not data:
+                    return
+        except Exception as e:
+            # Hand read errors to the consumer
+            put(e)
+
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
     try:
-        if is_compressed_file(file_path):
+        while True:
+            item = chunks.get()
+            if isinstance(item, Exception):
+                raise item
+            if not item:
+                return
+            yield item
+    finally:
+        # Don't let the caller close the file under a running read
+        stop.set()
+        producer.join()
+
+def _search_stream(chunks: Iterable[bytes], needles: List[bytes], matches: list,
+                   keep_lines: bool = False) -> None:
+    """
+    Search a stream of binary chunks in blocks that each end on a line boundary.
+
+    Matches are appended to matches as each block is searched, so the caller
+    keeps them if reading the stream fails part way through. With keep_lines,
+    matched line bytes are copied while each block is still in memory, for
+    streams that would be expensive to read back.
+    """
+    line_num = 1
+    block_offset = 0
+    # Pieces of the current partial line, joined only once its newline arrives
+    pieces = []
+    for data in chunks:
+        cut = data.rfind(b'\n') + 1
+        if cut == 0:
+            # No complete line yet, keep reading
+            pieces.append(data)
+            continue
+        pieces.append(data[:cut] if cut < len(data) else data)
+        block = b''.join(pieces) if len(pieces) > 1 else pieces[0]
+        pieces = [data[cut:]] if cut < len(data) else []
+        matches.extend(_search_buffer(block, needles, line_num, block_offset, keep_lines))
+        line_num += block.count(b'\n')
+        block_offset += len(block)
+    if pieces:
+        tail = b''.join(pieces)
+        matches.extend(_search_buffer(tail, needles, line_num, block_offset, keep_lines))
+
+def open_compressed(file_path: str, parallelization: int = 1):
+    """
+    Open a gzip-compressed file for binary reading.
+
+    Uses rapidgzip with the given number of threads when it is installed,
+    otherwise the single-threaded gzip module.
+    """
+    if rapidgzip is not None:
+        return rapidgzip.open(file_path, parallelization=parallelization)
+    return gzip.open(file_path, 'rb')
+
+def search_in_file(file_path: str, search_patterns: List[str], compressed: bool = False, gzip_threads: int = 1) -> List[Match]:
+    """Search for multiple patterns in a file and return line numbers, line offsets, and matched pattern."""
+    # Files are searched as bytes: encode the patterns once, decode only the matched lines when reporting
+    needles = [pattern.encode('utf-8') for pattern in search_patterns]
+    hits = []
+    try:
+        if compressed:
             # Handle compressed files
-            with gzip.open(file_path, 'rt', encoding='utf-8', errors='ignore') as f:
-                for line_num, line in enumerate(f, 1):
-                    for pattern in search_patterns:
-                        if pattern in line:
-                            matches.append((line_num, line.strip(), pattern))
-                            break  # Only record first match per line
+            with open_compressed(file_path, gzip_threads) as f:
+                chunks = _read_ahead(f, _GZIP_CHUNK, _GZIP_QUEUE_DEPTH)
+                _search_stream(chunks, needles, hits, keep_lines=True)
         else:
-            # Handle uncompressed files
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                for line_num, line in enumerate(f, 1):
-                    for pattern in search_patterns:
-                        if pattern in line:
-                            matches.append((line_num, line.strip(), pattern))
-                            break  # Only record first match per line
+            # Handle uncompressed files, memory-mapped where possible
+            try:
+                with open(file_path, 'rb') as raw, \
+                     mmap.mmap(raw.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    hits = _search_buffer(mm, needles)
+            except (ValueError, OSError):
+                # Empty files and file systems without mmap support
+                with open(file_path, 'rb') as f:
+                    chunks = iter(functools.partial(f.read, _READ_CHUNK), b'')
+                    _search_stream(chunks, needles, hits)
     except Exception as e:
         print(f"Error reading file {file_path}: {e}")
-    return matches
+    return [(line_num, start, end, search_patterns[index], line) for line_num, start, end, index, line in hits]
 
-def copy_matching_files(source_files: List[str], dest_dir: str, temp_dir: str) -> None:
-    """Copy files with matches to the destination directory, preserving structure."""
-    for file_path in source_files:
+def search_files(log_files: List[LogFile], search_patterns: List[str]) -> Iterator[Tuple[str, bool, List[Match]]]:
+    """
+    Search many log files, in parallel worker processes when there are enough of them.
+
+    Files are dispatched largest first so the longest jobs start early.
+    Yields (file_path, compressed, matches) in dispatch order.
+    """
+    workers = os.cpu_count() or 1
+    log_files = sorted(log_files, key=lambda log_file: log_file.size, reverse=True)
+    if len(log_files) < 4:
+        # Too few files to spread over processes: let the gzip decoder use the cores instead
+        for log_file in log_files:
+            matches = search_in_file(log_file.path, search_patterns, log_file.compressed, gzip_threads=workers)
+            yield log_file.path, log_file.compressed, matches
+        return
+
+    # Batch small files together, but keep enough batches to occupy every worker
+    chunksize = max(1, min(8, len(log_files) // (workers * 4)))
+    file_paths = [log_file.path for log_file in log_files]
+    flags = [log_file.compressed for log_file in log_files]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(search_in_file, file_paths, repeat(search_patterns), flags, chunksize=chunksize)
+        yield from zip(file_paths, flags, results)
+
+# Command lines for external fixed-string search engines. Both print
+# "path\0line:offset:content" for every matching line.
+_EXTERNAL_ENGINES = {
+    'rg': ['rg', '--no-config', '--fixed-strings', '--line-number', '--byte-offset',
+           '--with-filename', '--null', '--no-heading', '--text', '--color', 'never'],
+    'grep': ['grep', '--fixed-strings', '--line-number', '--byte-offset',
+             '--with-filename', '--null', '--text'],
+}
+
+# Paths per external engine invocation, to stay clear of the argument length limit
+_EXTERNAL_BATCH = 512
+
+def resolve_engine(engine: str) -> str:
+    """
+    Pick the search engine for uncompressed logs: 'python', 'rg' or 'grep'.
+
+    'auto' uses ripgrep when it is on the PATH. An external engine that is
+    not installed falls back to the built-in search.
+    """
+    if engine == 'auto':
+        return 'rg' if shutil.which('rg') else 'python'
+    if engine != 'python' and not shutil.which(engine):
+        print(f"Warning: {engine} not found, using the built-in search")
+        return 'python'
+    return engine
+
+def search_files_external(engine: str, log_files: List[LogFile], search_patterns: List[str],
+                          patterns_file: str) -> Iterator[Tuple[str, bool, List[Match]]]:
+    """
+    Search uncompressed log files with an external fixed-string engine (rg or grep).
+
+    The patterns are written to patterns_file, one per line. Yields
+    (file_path, compressed, matches) like search_files, for files with
+    matches only. The matched pattern of each line is the first of
+    search_patterns found in it.
+    """
+    needles = [pattern.encode('utf-8') for pattern in search_patterns]
+    with open(patterns_file, 'wb') as f:
+        f.write(b'\n'.join(needles) + b'\n')
+
+    command = _EXTERNAL_ENGINES[engine] + ['-f', patterns_file, '--']
+    file_paths = [log_file.path for log_file in log_files]
+    for i in range(0, len(file_paths), _EXTERNAL_BATCH):
+        batch = file_paths[i:i + _EXTERNAL_BATCH]
+        current_path, matches = None, []
+        with subprocess.Popen(command + batch, stdout=subprocess.PIPE) as proc:
+            # Each file's matching lines are printed together
+            for output_line in proc.stdout:
+                path, _, rest = output_line.partition(b'\0')
+                line_num, offset, content = rest.split(b':', 2)
+                content = content.rstrip(b'\n')
+                path = os.fsdecode(path)
+                if path != current_path:
+                    if matches:
+                        yield current_path, False, matches
+                    current_path, matches = path, []
+                start = int(offset)
+                index = next((index for index, needle in enumerate(needles) if needle in content), 0)
+                matches.append((int(line_num), start, start + len(content), search_patterns[index], None))
+        if matches:
+            yield current_path, False, matches
+        # Exit status 2 means some files could not be read; the engine names them on stderr
+        if proc.returncode == 2:
+            print(f"Warning: {engine} reported errors reading some log files; their matches may be missing")
+
+def read_match_lines(file_path: str, matches: List[Match]) -> Iterator[Tuple[int, str, str]]:
+    """
+    Return the text of matched lines, in file order.
+
+    Yields (line number, line content, matched pattern). Lines kept during
+    the search are used as they are; the rest are read back from the
+    (uncompressed) file by offset. Lines are cut at MAX_LINE_BYTES so
+    pathological lines don't bloat the report.
+    """
+    f = None
+    try:
+        for line_num, start, end, pattern, line in matches:
+            if line is None:
+                if f is None:
+                    f = open(file_path, 'rb')
+                f.seek(start)
+                line = f.read(min(end, start + MAX_LINE_BYTES) - start)
+            yield line_num, line.decode('utf-8', errors='ignore').strip(), pattern
+    finally:
+        if f is not None:
+            f.close()
+
+def copy_matching_files(source_files: List[LogFile], dest_dir: str, temp_dir: str) -> None:
+    """Copy files with matches to the destination directory, preserving structure and modification times."""
+    created_dirs = set()
+    for log_file in source_files:
         # Create relative path from temp directory
-        rel_path = os.path.relpath(file_path, temp_dir)
+        rel_path = os.path.relpath(log_file.path, temp_dir)
         dest_path = os.path.join(dest_dir, rel_path)
         
-        # Create destination directory if it doesn't exist
-        os.makedirs(os.path.dirname(dest_path), exist_ok=True)
+        # Create destination directory once per directory
+        parent = os.path.dirname(dest_path)
+        if parent not in created_dirs:
+            os.makedirs(parent, exist_ok=True)
+            created_dirs.add(parent)
         
-        # Copy the file
-        shutil.copy2(file_path, dest_path)
+        # Copy the contents with the kernel's zero-copy path where available,
+        # then restore the original modification time from the scan
+        shutil.copyfile(log_file.path, dest_path)
+        os.utime(dest_path, (log_file.mtime, log_file.mtime))
 
 def main():
     parser = argparse.ArgumentParser(description='Search for strings in log files within nested tar archives')
@@ -153,6 +720,9 @@ def main():
     parser.add_argument('search_string', help='String to search for')
     parser.add_argument('-o', '--output', default='search_results', help='Output directory name (default: search_results)')
     parser.add_argument('-tf', '--timestamp-format', action='store_true', help='Enable timestamp format pattern matching (searches for multiple timestamp formats)')
+    parser.add_argument('--since', type=parse_date, help='Skip log files last modified before this date (yyyy-MM-dd)')
+    parser.add_argument('--until', type=parse_date, help='Skip log files last modified after this date (yyyy-MM-dd)')
+    parser.add_argument('--engine', choices=['auto', 'python', 'rg', 'grep'], default='auto', help='Search engine for uncompressed logs (default: auto, ripgrep if installed)')
     
     args = parser.parse_args()
     
@@ -160,6 +730,9 @@ def main():
     search_string = args.search_string
     output_dir = args.output
     use_timestamp_format = args.timestamp_format
+    since = args.since
+    until = args.until
+    engine = resolve_engine(args.engine)
     
     # Create output directory
     if os.path.exists(output_dir):
@@ -186,23 +759,17 @@ def main():
         
         # Step 2: Find and extract all .tar.gz files
         print("Searching for .tar.gz files...")
-        tar_gz_files = find_tar_gz_files(work_dir)
+        tar_gz_files, _, _ = classify_tree(work_dir)
         print(f"Found {len(tar_gz_files)} .tar.gz files")
         
         extraction_dir = os.path.join(temp_dir, 'extracted_content')
         os.makedirs(extraction_dir, exist_ok=True)
         
-        for tar_gz_file in tar_gz_files:
-            print(f"Extracting: {os.path.basename(tar_gz_file)}")
-            try:
-                extract_tar_file(tar_gz_file, extraction_dir)
-            except Exception as e:
-                print(f"Error extracting {tar_gz_file}: {e}")
+        extract_tar_gz_files(tar_gz_files, extraction_dir)
         
         # Step 3: Find all log files (both compressed and uncompressed)
         print("Searching for log files...")
-        log_files = find_log_files(extraction_dir)
-        compressed_log_files = find_compressed_log_files(extraction_dir)
+        _, log_files, compressed_log_files = classify_tree(extraction_dir)
         all_log_files = log_files + compressed_log_files
         
         print(f"Found {len(log_files)} uncompressed log files")
@@ -210,7 +777,8 @@ def main():
         print(f"Total log files: {len(all_log_files)}")
         
         # Determine search patterns based on -tf flag
-        if use_timestamp_format and is_timestamp_format(search_string):
+        timestamp_mode = use_timestamp_format and is_timestamp_format(search_string)
+        if timestamp_mode:
             search_patterns = parse_timestamp_input(search_string)
             print(f"Timestamp format mode enabled. Searching for {len(search_patterns)} timestamp patterns:")
             for i, pattern in enumerate(search_patterns, 1):
@@ -223,21 +791,66 @@ def main():
             search_patterns = [search_string]
             print(f"Searching for string: '{search_string}'")
         
+        # Skip empty files and files last modified outside the time window.
+        # A log can't contain a timestamp from after its last write, so in
+        # timestamp mode files older than the target (less a day of slack
+        # for time zones) are skipped. No implicit upper bound is applied,
+        # since a long-running log keeps being written after the target.
+        if timestamp_mode and since is None:
+            try:
+                since = timestamp_to_datetime(search_string) - timedelta(days=1)
+            except (ValueError, OverflowError) as e:
+                print(f"Warning: '{search_string}' is not a valid date ({e}); not filtering log files by modification time")
+        since_ts = since.timestamp() if since else None
+        until_ts = (until + timedelta(days=1)).timestamp() if until else None
+        searched_log_files = [
+            log_file for log_file in all_log_files
+            if log_file.size > 0
+            and (since_ts is None or log_file.mtime >= since_ts)
+            and (until_ts is None or log_file.mtime < until_ts)
+        ]
+        skipped = len(all_log_files) - len(searched_log_files)
+        if skipped:
+            print(f"Skipping {skipped} empty or out-of-window log files")
+        
         # Step 4: Search for the patterns in log files
+        # Per-file results are written to a temporary file as they arrive, so
+        # only counters are kept in memory until the summary header is known
         print(f"Searching in log files...")
-        results = {}
+        details_file = os.path.join(temp_dir, 'result.txt.tmp')
         files_with_matches = []
         total_matches = 0
         
-        for log_file in all_log_files:
-            matches = search_in_file(log_file, search_patterns)
-            if matches:
-                rel_path = os.path.relpath(log_file, extraction_dir)
-                results[rel_path] = matches
-                files_with_matches.append(log_file)
-                total_matches += len(matches)
-                file_type = "compressed" if is_compressed_file(log_file) else "uncompressed"
-                print(f"Found {len(matches)} matches in {rel_path} ({file_type})")
+        if engine == 'python':
+            search_results = search_files(searched_log_files, search_patterns)
+        else:
+            # The external engine handles plain logs; compressed logs stay with the built-in search
+            print(f"Using {engine} for uncompressed log files")
+            patterns_file = os.path.join(temp_dir, 'patterns.txt')
+            uncompressed = [log_file for log_file in searched_log_files if not log_file.compressed]
+            compressed_only = [log_file for log_file in searched_log_files if log_file.compressed]
+            search_results = chain(search_files_external(engine, uncompressed, search_patterns, patterns_file),
+                                   search_files(compressed_only, search_patterns))
+        
+        log_files_by_path = {log_file.path: log_file for log_file in searched_log_files}
+        with open(details_file, 'w', encoding='utf-8') as details:
+            for log_file, compressed, matches in search_results:
+                if matches:
+                    rel_path = os.path.relpath(log_file, extraction_dir)
+                    files_with_matches.append(log_files_by_path[log_file])
+                    total_matches += len(matches)
+                    file_type = "compressed" if compressed else "uncompressed"
+                    print(f"Found {len(matches)} matches in {rel_path} ({file_type})")
+                    
+                    details.write(f"File: {rel_path} ({file_type})\n")
+                    details.write(f"Matches: {len(matches)}\n")
+                    details.write("Lines:\n")
+                    for line_num, line_content, matched_pattern in read_match_lines(log_file, matches):
+                        if timestamp_mode:
+                            details.write(f"  Line {line_num} [matched: {matched_pattern}]: {line_content}\n")
+                        else:
+                            details.write(f"  Line {line_num}: {line_content}\n")
+                    details.write("\n")
         
         # Step 5: Copy matching files to output directory
         if files_with_matches:
@@ -247,7 +860,7 @@ def main():
         # Step 6: Generate results summary
         result_file = os.path.join(output_dir, 'result.txt')
         with open(result_file, 'w', encoding='utf-8') as f:
-            if use_timestamp_format and is_timestamp_format(search_string):
+            if timestamp_mode:
                 f.write(f"Timestamp Search Results for: '{search_string}'\n")
                 f.write(f"{'='*50}\n")
                 f.write(f"Search patterns used:\n")
@@ -258,27 +871,20 @@ def main():
                 f.write(f"Search Results for: '{search_string}'\n")
                 f.write(f"{'='*50}\n\n")
             
-            f.write(f"Total files searched: {len(all_log_files)}\n")
-            f.write(f"  - Uncompressed: {len(log_files)}\n")
-            f.write(f"  - Compressed: {len(compressed_log_files)}\n")
+            compressed_searched = sum(1 for log_file in searched_log_files if log_file.compressed)
+            f.write(f"Total files searched: {len(searched_log_files)}\n")
+            f.write(f"  - Uncompressed: {len(searched_log_files) - compressed_searched}\n")
+            f.write(f"  - Compressed: {compressed_searched}\n")
+            if skipped:
+                f.write(f"Files skipped (empty or outside time window): {skipped}\n")
             f.write(f"Files with matches: {len(files_with_matches)}\n")
             f.write(f"Total matches found: {total_matches}\n\n")
             
-            if results:
+            if files_with_matches:
                 f.write("Detailed Results:\n")
                 f.write("-" * 30 + "\n\n")
-                
-                for file_path, matches in results.items():
-                    file_type = "compressed" if any(pattern in file_path for pattern in ['.gz', '.log.gz_']) else "uncompressed"
-                    f.write(f"File: {file_path} ({file_type})\n")
-                    f.write(f"Matches: {len(matches)}\n")
-                    f.write("Lines:\n")
-                    for line_num, line_content, matched_pattern in matches:
-                        if use_timestamp_format and is_timestamp_format(search_string):
-                            f.write(f"  Line {line_num} [matched: {matched_pattern}]: {line_content}\n")
-                        else:
-                            f.write(f"  Line {line_num}: {line_content}\n")
-                    f.write("\n")
+                with open(details_file, 'r', encoding='utf-8') as details:
+                    shutil.copyfileobj(details, f)
             else:
                 f.write("No matches found.\n")
     